@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 """Generate pixel art sprites for the RTS game."""
 
-from PIL import Image, ImageDraw
+import argparse
+import functools
+import hashlib
+import io
+import json
+import numpy as np
+from PIL import Image, PngImagePlugin
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import os
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "textures", "sprites")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -13,173 +25,283 @@ CONTINUITY_BLUE = (51, 102, 204)
 COLLEGIUM_GOLD = (204, 153, 51)
 
 
+# ---------------------------------------------------------------------------
+# NumPy rasterization helpers
+#
+# Sprites are built in a single preallocated (H, W, 4) uint8 array and
+# converted to a PIL Image once at the end, instead of issuing one ImageDraw
+# call per primitive. Boxes are inclusive of both corners, matching the
+# ImageDraw convention the sprite geometry was written against. All helpers
+# clip to the array bounds.
+# ---------------------------------------------------------------------------
+
+
+def new_sprite(width, height):
+    """Allocate a transparent RGBA pixel array."""
+    return np.zeros((height, width, 4), dtype=np.uint8)
+
+
+def fill_rect(arr, x0, y0, x1, y1, rgba):
+    """Fill an axis-aligned rectangle given by inclusive corners."""
+    h, w = arr.shape[:2]
+    arr[max(y0, 0):min(y1 + 1, h), max(x0, 0):min(x1 + 1, w)] = rgba
+
+
+@functools.lru_cache(maxsize=256)
+def ellipse_mask(w, h):
+    """Boolean mask of the ellipse inscribed in a w x h box.
+
+    Many sprites draw ellipses of identical dimensions (wheels, windows,
+    glints), so masks are memoized per (w, h) instead of re-rasterized.
+    Cached masks are shared; callers must treat them as read-only.
+    """
+    rx = max((w - 1) / 2.0, 0.5)
+    ry = max((h - 1) / 2.0, 0.5)
+    yy, xx = np.ogrid[:h, :w]
+    return ((yy - (h - 1) / 2.0) / ry) ** 2 + ((xx - (w - 1) / 2.0) / rx) ** 2 <= 1.0
+
+
+def fill_ellipse(arr, x0, y0, x1, y1, rgba):
+    """Fill the ellipse inscribed in the inclusive box [x0, y0, x1, y1]."""
+    h, w = arr.shape[:2]
+    mask = ellipse_mask(x1 - x0 + 1, y1 - y0 + 1)
+    cy0, cy1 = max(y0, 0), min(y1 + 1, h)
+    cx0, cx1 = max(x0, 0), min(x1 + 1, w)
+    if cy0 >= cy1 or cx0 >= cx1:
+        return
+    clipped = mask[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+    arr[cy0:cy1, cx0:cx1][clipped] = rgba
+
+
+@functools.lru_cache(maxsize=256)
+def polygon_mask(points, w, h):
+    """Boolean mask of a filled polygon via even-odd scanline fill.
+
+    ``points`` is a tuple of (x, y) tuples so repeated shapes (stars,
+    crystals) hit the memo cache; callers must treat the result as
+    read-only.
+    """
+    mask = np.zeros((h, w), dtype=bool)
+    ys = [p[1] for p in points]
+    n = len(points)
+    for y in range(max(int(min(ys)), 0), min(int(max(ys)), h - 1) + 1):
+        xs = []
+        for i in range(n):
+            xa, ya = points[i]
+            xb, yb = points[(i + 1) % n]
+            if ya == yb:
+                continue
+            if (ya <= y < yb) or (yb <= y < ya):
+                xs.append(xa + (y - ya) * (xb - xa) / (yb - ya))
+        xs.sort()
+        for xa, xb in zip(xs[::2], xs[1::2]):
+            x_lo = max(int(np.ceil(xa)), 0)
+            x_hi = min(int(np.floor(xb)), w - 1)
+            if x_hi >= x_lo:
+                mask[y, x_lo:x_hi + 1] = True
+    return mask
+
+
+def fill_polygon(arr, points, rgba):
+    """Fill the polygon described by a list of (x, y) vertices."""
+    h, w = arr.shape[:2]
+    arr[polygon_mask(tuple(tuple(p) for p in points), w, h)] = rgba
+
+
+def _stamp_along(arr, xs, ys, rgba, width):
+    """Stamp a width x width square at each (x, y) sample point."""
+    h, w = arr.shape[:2]
+    r = width // 2
+    for x, y in zip(xs, ys):
+        fill_rect(arr, x - r, y - r, x - r + width - 1, y - r + width - 1, rgba)
+
+
+def draw_line(arr, x0, y0, x1, y1, rgba, width=1):
+    """Draw a straight line of the given pixel width."""
+    n = int(max(abs(x1 - x0), abs(y1 - y0))) + 1
+    xs = np.linspace(x0, x1, n).round().astype(int)
+    ys = np.linspace(y0, y1, n).round().astype(int)
+    _stamp_along(arr, xs, ys, rgba, width)
+
+
+def draw_arc(arr, x0, y0, x1, y1, start, end, rgba, width=1):
+    """Draw an elliptical arc between two angles (degrees, clockwise)."""
+    cx, cy = (x0 + x1) / 2.0, (y0 + y1) / 2.0
+    rx, ry = (x1 - x0) / 2.0, (y1 - y0) / 2.0
+    steps = max(int(4 * (rx + ry)), 8)
+    theta = np.radians(np.linspace(start, end, steps))
+    xs = (cx + rx * np.cos(theta)).round().astype(int)
+    ys = (cy + ry * np.sin(theta)).round().astype(int)
+    _stamp_along(arr, xs, ys, rgba, width)
+
+
 def create_infantry_sprite(size=32):
     """Create a soldier/infantry sprite - humanoid with rifle."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
+    # size is effectively a compile-time constant (see SPRITE_FACTORIES),
+    # so derived proportions are folded once up front instead of being
+    # recomputed inline at every use.
     cx, cy = size // 2, size // 2
-    
+    quarter, fifth, sixth = size // 4, size // 5, size // 6
+
     # Head (circle at top)
     head_r = size // 8
-    draw.ellipse([cx - head_r, 4, cx + head_r, 4 + head_r * 2], fill=(200, 200, 200, 255))
-    
+    fill_ellipse(arr, cx - head_r, 4, cx + head_r, 4 + head_r * 2, (200, 200, 200, 255))
+
     # Body (torso)
     body_top = 4 + head_r * 2
-    body_bottom = cy + size // 4
-    draw.rectangle([cx - size//6, body_top, cx + size//6, body_bottom], fill=(100, 100, 100, 255))
-    
+    body_bottom = cy + quarter
+    fill_rect(arr, cx - sixth, body_top, cx + sixth, body_bottom, (100, 100, 100, 255))
+
     # Legs
     leg_w = size // 10
-    draw.rectangle([cx - size//5, body_bottom, cx - size//5 + leg_w, size - 4], fill=(80, 80, 80, 255))
-    draw.rectangle([cx + size//5 - leg_w, body_bottom, cx + size//5, size - 4], fill=(80, 80, 80, 255))
-    
+    fill_rect(arr, cx - fifth, body_bottom, cx - fifth + leg_w, size - 4, (80, 80, 80, 255))
+    fill_rect(arr, cx + fifth - leg_w, body_bottom, cx + fifth, size - 4, (80, 80, 80, 255))
+
     # Arms
-    draw.rectangle([cx - size//4, body_top + 2, cx - size//6, body_bottom - 4], fill=(100, 100, 100, 255))
-    draw.rectangle([cx + size//6, body_top + 2, cx + size//4, body_bottom - 4], fill=(100, 100, 100, 255))
-    
+    fill_rect(arr, cx - quarter, body_top + 2, cx - sixth, body_bottom - 4, (100, 100, 100, 255))
+    fill_rect(arr, cx + sixth, body_top + 2, cx + quarter, body_bottom - 4, (100, 100, 100, 255))
+
     # Rifle (diagonal line from hands)
-    draw.line([cx + size//4, body_top + 4, cx + size//3 + 4, body_top - 4], fill=(60, 60, 60, 255), width=2)
-    
-    return img
+    draw_line(arr, cx + quarter, body_top + 4, cx + size//3 + 4, body_top - 4, (60, 60, 60, 255), width=2)
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_ranger_sprite(size=32):
     """Create a ranger/sniper sprite - taller, with long rifle."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     cx = size // 2
-    
+    quarter = size // 4
+
     # Slimmer, taller proportions
     # Head with hood
     head_r = size // 10
-    draw.ellipse([cx - head_r - 1, 2, cx + head_r + 1, 2 + head_r * 2 + 2], fill=(60, 80, 60, 255))  # Hood
-    draw.ellipse([cx - head_r, 3, cx + head_r, 3 + head_r * 2], fill=(180, 160, 140, 255))  # Face
-    
+    fill_ellipse(arr, cx - head_r - 1, 2, cx + head_r + 1, 2 + head_r * 2 + 2, (60, 80, 60, 255))  # Hood
+    fill_ellipse(arr, cx - head_r, 3, cx + head_r, 3 + head_r * 2, (180, 160, 140, 255))  # Face
+
     # Cloak/body (triangular)
     body_top = 3 + head_r * 2
-    draw.polygon([
+    fill_polygon(arr, [
         (cx, body_top),
-        (cx - size//4, size - 6),
-        (cx + size//4, size - 6)
-    ], fill=(50, 70, 50, 255))
-    
+        (cx - quarter, size - 6),
+        (cx + quarter, size - 6)
+    ], (50, 70, 50, 255))
+
     # Long sniper rifle
-    draw.line([cx - 2, body_top + 4, cx + size//2 - 2, 0], fill=(40, 40, 40, 255), width=3)
-    
+    draw_line(arr, cx - 2, body_top + 4, cx + size//2 - 2, 0, (40, 40, 40, 255), width=3)
+
     # Scope glint
-    draw.ellipse([cx + size//4 - 1, 2, cx + size//4 + 2, 5], fill=(100, 200, 255, 255))
-    
-    return img
+    fill_ellipse(arr, cx + quarter - 1, 2, cx + quarter + 2, 5, (100, 200, 255, 255))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_harvester_sprite(size=36):
     """Create a harvester/worker vehicle sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
+    half, third, quarter = size // 2, size // 3, size // 4
+
     # Main body (boxy vehicle)
     body_margin = 4
-    draw.rectangle([body_margin, size//3, size - body_margin, size - 6], fill=(180, 140, 60, 255))
-    
+    fill_rect(arr, body_margin, third, size - body_margin, size - 6, (180, 140, 60, 255))
+
     # Cab (smaller box on top)
-    cab_w = size // 3
-    cx = size // 2
-    draw.rectangle([cx - cab_w//2, 6, cx + cab_w//2, size//3 + 2], fill=(160, 120, 40, 255))
-    
+    cab_w = third
+    cx = half
+    fill_rect(arr, cx - cab_w//2, 6, cx + cab_w//2, third + 2, (160, 120, 40, 255))
+
     # Window
-    draw.rectangle([cx - cab_w//4, 8, cx + cab_w//4, size//4], fill=(100, 180, 220, 255))
-    
+    fill_rect(arr, cx - cab_w//4, 8, cx + cab_w//4, quarter, (100, 180, 220, 255))
+
     # Scoop/bucket at front
-    draw.polygon([
+    fill_polygon(arr, [
         (2, size - 8),
-        (body_margin, size//2),
-        (body_margin + size//4, size//2),
-        (body_margin + size//4 + 2, size - 8)
-    ], fill=(120, 100, 40, 255))
-    
+        (body_margin, half),
+        (body_margin + quarter, half),
+        (body_margin + quarter + 2, size - 8)
+    ], (120, 100, 40, 255))
+
     # Wheels/tracks
     track_y = size - 5
-    draw.ellipse([body_margin, track_y - 3, body_margin + 8, track_y + 3], fill=(40, 40, 40, 255))
-    draw.ellipse([size - body_margin - 8, track_y - 3, size - body_margin, track_y + 3], fill=(40, 40, 40, 255))
-    
-    # Cargo indicator lines
-    for i in range(3):
-        y = size//2 + 4 + i * 4
-        draw.line([body_margin + 4, y, size - body_margin - 4, y], fill=(140, 100, 40, 255), width=1)
-    
-    return img
+    fill_ellipse(arr, body_margin, track_y - 3, body_margin + 8, track_y + 3, (40, 40, 40, 255))
+    fill_ellipse(arr, size - body_margin - 8, track_y - 3, size - body_margin, track_y + 3, (40, 40, 40, 255))
+
+    # Cargo indicator lines (three rows in one fancy-indexed assignment)
+    line_ys = half + 4 + np.arange(3) * 4
+    arr[line_ys, body_margin + 4:size - body_margin - 3] = (140, 100, 40, 255)
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_depot_sprite(size=64):
     """Create a main depot/base building sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     margin = 4
-    
+    cx, quarter = size // 2, size // 4
+
     # Main structure (large building)
-    draw.rectangle([margin, size//4, size - margin, size - margin], fill=(100, 110, 130, 255))
-    
+    fill_rect(arr, margin, quarter, size - margin, size - margin, (100, 110, 130, 255))
+
     # Roof (darker)
-    draw.polygon([
-        (margin, size//4),
-        (size//2, margin),
-        (size - margin, size//4)
-    ], fill=(70, 80, 100, 255))
-    
-    # Windows (grid)
+    fill_polygon(arr, [
+        (margin, quarter),
+        (cx, margin),
+        (size - margin, quarter)
+    ], (70, 80, 100, 255))
+
+    # Windows (grid): the 2x4 layout is a cross product of row and column
+    # pixel runs, so np.ix_ paints every window in one broadcast assignment.
     win_color = (80, 160, 200, 255)
     win_size = 6
-    for row in range(2):
-        for col in range(4):
-            wx = margin + 8 + col * 12
-            wy = size//4 + 8 + row * 14
-            draw.rectangle([wx, wy, wx + win_size, wy + win_size], fill=win_color)
-    
+    win_rows = (quarter + 8 + np.arange(2) * 14)[:, None] + np.arange(win_size + 1)
+    win_cols = (margin + 8 + np.arange(4) * 12)[:, None] + np.arange(win_size + 1)
+    arr[np.ix_(win_rows.ravel(), win_cols.ravel())] = win_color
+
     # Door
     door_w = 12
     door_h = 16
-    cx = size // 2
-    draw.rectangle([cx - door_w//2, size - margin - door_h, cx + door_w//2, size - margin], fill=(60, 50, 40, 255))
-    
+    fill_rect(arr, cx - door_w//2, size - margin - door_h, cx + door_w//2, size - margin, (60, 50, 40, 255))
+
     # Antenna/comm tower
-    draw.line([size - margin - 8, margin + 4, size - margin - 8, size//4], fill=(80, 80, 80, 255), width=2)
-    draw.ellipse([size - margin - 11, margin + 1, size - margin - 5, margin + 7], fill=(255, 100, 100, 255))
-    
-    return img
+    draw_line(arr, size - margin - 8, margin + 4, size - margin - 8, quarter, (80, 80, 80, 255), width=2)
+    fill_ellipse(arr, size - margin - 11, margin + 1, size - margin - 5, margin + 7, (255, 100, 100, 255))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_barracks_sprite(size=48):
     """Create a barracks building sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     margin = 3
-    
+    half, third, fifth = size // 2, size // 3, size // 5
+    cx = half
+
     # Main building (military style, flat roof)
-    draw.rectangle([margin, size//5, size - margin, size - margin], fill=(90, 85, 80, 255))
-    
+    fill_rect(arr, margin, fifth, size - margin, size - margin, (90, 85, 80, 255))
+
     # Flat reinforced roof
-    draw.rectangle([margin - 1, size//5 - 3, size - margin + 1, size//5 + 2], fill=(70, 65, 60, 255))
-    
-    # Windows (narrow slits - bunker style)
-    for i in range(3):
-        wx = margin + 8 + i * 12
-        draw.rectangle([wx, size//3, wx + 8, size//3 + 4], fill=(40, 60, 80, 255))
-    
+    fill_rect(arr, margin - 1, fifth - 3, size - margin + 1, fifth + 2, (70, 65, 60, 255))
+
+    # Windows (narrow slits - bunker style), all three in one assignment
+    slit_cols = (margin + 8 + np.arange(3) * 12)[:, None] + np.arange(9)
+    arr[np.ix_(np.arange(third, third + 5), slit_cols.ravel())] = (40, 60, 80, 255)
+
     # Large door (hangar style)
     door_w = 20
-    cx = size // 2
-    draw.rectangle([cx - door_w//2, size//2, cx + door_w//2, size - margin], fill=(50, 50, 50, 255))
+    fill_rect(arr, cx - door_w//2, half, cx + door_w//2, size - margin, (50, 50, 50, 255))
     # Door lines
-    draw.line([cx, size//2, cx, size - margin], fill=(40, 40, 40, 255), width=1)
-    
+    draw_line(arr, cx, half, cx, size - margin, (40, 40, 40, 255), width=1)
+
     # Military emblem (star)
     star_cx = size - margin - 10
-    star_cy = size//3 + 8
-    draw.polygon([
+    star_cy = third + 8
+    fill_polygon(arr, [
         (star_cx, star_cy - 5),
         (star_cx + 2, star_cy - 1),
         (star_cx + 5, star_cy),
@@ -188,162 +310,162 @@ def create_barracks_sprite(size=48):
         (star_cx - 2, star_cy + 1),
         (star_cx - 5, star_cy),
         (star_cx - 2, star_cy - 1),
-    ], fill=(180, 50, 50, 255))
-    
-    return img
+    ], (180, 50, 50, 255))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_supply_depot_sprite(size=32):
     """Create a supply depot sprite (storage building)."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     margin = 2
-    
+    half, third = size // 2, size // 3
+
     # Warehouse style building
-    draw.rectangle([margin, size//3, size - margin, size - margin], fill=(140, 130, 110, 255))
-    
+    fill_rect(arr, margin, third, size - margin, size - margin, (140, 130, 110, 255))
+
     # Curved/peaked roof
-    draw.polygon([
-        (margin, size//3),
-        (size//2, margin + 2),
-        (size - margin, size//3)
-    ], fill=(120, 80, 60, 255))
-    
+    fill_polygon(arr, [
+        (margin, third),
+        (half, margin + 2),
+        (size - margin, third)
+    ], (120, 80, 60, 255))
+
     # Large cargo door
-    door_w = size - 8
-    draw.rectangle([4, size//2, size - 4, size - margin], fill=(100, 90, 70, 255))
-    
+    fill_rect(arr, 4, half, size - 4, size - margin, (100, 90, 70, 255))
+
     # Crates visible through door
-    draw.rectangle([6, size//2 + 4, 12, size - 4], fill=(180, 140, 80, 255))
-    draw.rectangle([14, size//2 + 6, 20, size - 4], fill=(160, 120, 60, 255))
-    draw.rectangle([22, size//2 + 4, 28, size - 4], fill=(170, 130, 70, 255))
-    
-    return img
+    fill_rect(arr, 6, half + 4, 12, size - 4, (180, 140, 80, 255))
+    fill_rect(arr, 14, half + 6, 20, size - 4, (160, 120, 60, 255))
+    fill_rect(arr, 22, half + 4, 28, size - 4, (170, 130, 70, 255))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_tech_lab_sprite(size=40):
     """Create a tech lab building sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     margin = 3
     cx = size // 2
-    
+    third, quarter, fifth = size // 3, size // 4, size // 5
+
     # Modern/futuristic building
-    draw.rectangle([margin, size//4, size - margin, size - margin], fill=(80, 70, 120, 255))
-    
+    fill_rect(arr, margin, quarter, size - margin, size - margin, (80, 70, 120, 255))
+
     # Dome on top
-    draw.ellipse([cx - size//4, margin, cx + size//4, size//3], fill=(100, 90, 150, 255))
-    
-    # Glowing windows
+    fill_ellipse(arr, cx - quarter, margin, cx + quarter, third, (100, 90, 150, 255))
+
+    # Glowing windows: the 2x2 grid shares one ellipse template, tiled over
+    # the cross product of window rows and columns in a single masked write.
     win_color = (100, 200, 255, 255)
-    for i in range(2):
-        for j in range(2):
-            wx = margin + 6 + i * 16
-            wy = size//3 + 4 + j * 10
-            draw.ellipse([wx, wy, wx + 8, wy + 6], fill=win_color)
-    
+    win_mask = ellipse_mask(9, 7)
+    win_rows = (third + 4 + np.arange(2) * 10)[:, None] + np.arange(7)
+    win_cols = (margin + 6 + np.arange(2) * 16)[:, None] + np.arange(9)
+    win_region = arr[np.ix_(win_rows.ravel(), win_cols.ravel())]
+    win_region[np.tile(win_mask, (2, 2))] = win_color
+    arr[np.ix_(win_rows.ravel(), win_cols.ravel())] = win_region
+
     # Central energy core (glowing)
-    draw.ellipse([cx - 4, size//5, cx + 4, size//5 + 8], fill=(150, 100, 255, 255))
-    
+    fill_ellipse(arr, cx - 4, fifth, cx + 4, fifth + 8, (150, 100, 255, 255))
+
     # Satellite dish
-    draw.arc([size - margin - 12, margin, size - margin, margin + 10], 180, 360, fill=(150, 150, 150, 255), width=2)
-    draw.line([size - margin - 6, margin + 5, size - margin - 6, margin + 12], fill=(100, 100, 100, 255), width=1)
-    
-    return img
+    draw_arc(arr, size - margin - 12, margin, size - margin, margin + 10, 180, 360, (150, 150, 150, 255), width=2)
+    draw_line(arr, size - margin - 6, margin + 5, size - margin - 6, margin + 12, (100, 100, 100, 255), width=1)
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_turret_sprite(size=24):
     """Create a defensive turret sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     cx, cy = size // 2, size // 2
-    
+
     # Base (octagonal platform)
     base_r = size // 3
-    draw.ellipse([cx - base_r, size - 8, cx + base_r, size - 2], fill=(80, 80, 80, 255))
-    
+    fill_ellipse(arr, cx - base_r, size - 8, cx + base_r, size - 2, (80, 80, 80, 255))
+
     # Support column
     col_w = 4
-    draw.rectangle([cx - col_w, cy, cx + col_w, size - 6], fill=(100, 100, 100, 255))
-    
+    fill_rect(arr, cx - col_w, cy, cx + col_w, size - 6, (100, 100, 100, 255))
+
     # Turret head (rotating part)
     head_r = size // 4
-    draw.ellipse([cx - head_r, cy - head_r + 2, cx + head_r, cy + head_r + 2], fill=(120, 120, 120, 255))
-    
+    fill_ellipse(arr, cx - head_r, cy - head_r + 2, cx + head_r, cy + head_r + 2, (120, 120, 120, 255))
+
     # Gun barrel
-    draw.rectangle([cx - 2, 2, cx + 2, cy], fill=(60, 60, 60, 255))
-    
+    fill_rect(arr, cx - 2, 2, cx + 2, cy, (60, 60, 60, 255))
+
     # Muzzle flash area
-    draw.ellipse([cx - 3, 0, cx + 3, 5], fill=(255, 200, 100, 200))
-    
-    return img
+    fill_ellipse(arr, cx - 3, 0, cx + 3, 5, (255, 200, 100, 200))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_resource_node_sprite(size=40, permanent=False):
     """Create a resource node sprite."""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, size)
+
     cx, cy = size // 2, size // 2
-    
+
     if permanent:
         # Permanent node - crystalline/rich deposit
         # Central crystal
         color = (60, 200, 100, 255)
-        draw.polygon([
+        fill_polygon(arr, [
             (cx, 4),
             (cx + 10, cy - 4),
             (cx + 8, size - 8),
             (cx - 8, size - 8),
             (cx - 10, cy - 4)
-        ], fill=color)
-        
+        ], color)
+
         # Side crystals
-        draw.polygon([
+        fill_polygon(arr, [
             (6, cy),
             (14, 8),
             (16, cy + 6)
-        ], fill=(80, 220, 120, 255))
-        
-        draw.polygon([
+        ], (80, 220, 120, 255))
+
+        fill_polygon(arr, [
             (size - 6, cy),
             (size - 14, 10),
             (size - 16, cy + 4)
-        ], fill=(50, 180, 90, 255))
-        
+        ], (50, 180, 90, 255))
+
         # Glow effect
-        draw.ellipse([cx - 6, cy - 2, cx + 6, cy + 8], fill=(100, 255, 150, 100))
+        fill_ellipse(arr, cx - 6, cy - 2, cx + 6, cy + 8, (100, 255, 150, 100))
     else:
         # Temporary node - ore pile
         color = (220, 180, 60, 255)
-        
+
         # Pile of ore chunks
-        draw.ellipse([4, size//2, size - 4, size - 4], fill=(180, 140, 40, 255))
-        
-        # Individual chunks on top
-        for i in range(5):
-            ox = 8 + (i % 3) * 10 + (i // 3) * 5
-            oy = size//3 + (i % 2) * 8
-            chunk_size = 8 + (i % 3) * 2
-            draw.ellipse([ox, oy, ox + chunk_size, oy + chunk_size], fill=color)
-        
+        fill_ellipse(arr, 4, size//2, size - 4, size - 4, (180, 140, 40, 255))
+
+        # Individual chunks on top; positions and sizes come from one
+        # arange so only the (three distinct) ellipse blits stay in Python.
+        idx = np.arange(5)
+        oxs = 8 + (idx % 3) * 10 + (idx // 3) * 5
+        oys = size//3 + (idx % 2) * 8
+        chunk_sizes = 8 + (idx % 3) * 2
+        for ox, oy, chunk_size in zip(oxs, oys, chunk_sizes):
+            fill_ellipse(arr, ox, oy, ox + chunk_size, oy + chunk_size, color)
+
         # Metallic glints
-        draw.ellipse([cx - 2, cy - 4, cx + 2, cy], fill=(255, 240, 180, 255))
-        draw.ellipse([cx + 6, cy + 2, cx + 9, cy + 5], fill=(255, 230, 160, 255))
-    
-    return img
+        fill_ellipse(arr, cx - 2, cy - 4, cx + 2, cy, (255, 240, 180, 255))
+        fill_ellipse(arr, cx + 6, cy + 2, cx + 9, cy + 5, (255, 230, 160, 255))
+
+    return Image.fromarray(arr, "RGBA")
 
 
 def create_terrain_sprite(size=80):
     """Create a terrain obstacle sprite (rocks/debris)."""
-    img = Image.new("RGBA", (size, 60), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    arr = new_sprite(size, 60)
+
     # Large rock formation
-    draw.polygon([
+    fill_polygon(arr, [
         (10, 55),
         (5, 35),
         (15, 15),
@@ -352,90 +474,487 @@ def create_terrain_sprite(size=80):
         (70, 20),
         (75, 40),
         (70, 55)
-    ], fill=(100, 95, 85, 255))
-    
+    ], (100, 95, 85, 255))
+
     # Highlights
-    draw.polygon([
+    fill_polygon(arr, [
         (20, 45),
         (18, 30),
         (30, 18),
         (45, 20),
         (48, 35)
-    ], fill=(120, 115, 105, 255))
-    
+    ], (120, 115, 105, 255))
+
     # Shadow areas
-    draw.polygon([
+    fill_polygon(arr, [
         (50, 50),
         (55, 25),
         (68, 30),
         (70, 50)
-    ], fill=(80, 75, 65, 255))
-    
-    return img
-
-
-def apply_faction_tint(img, faction_color, intensity=0.4):
-    """Apply a faction color tint to an image."""
-    result = img.copy()
-    pixels = result.load()
-    
-    for y in range(result.height):
-        for x in range(result.width):
-            r, g, b, a = pixels[x, y]
-            if a > 0:  # Only tint non-transparent pixels
-                # Blend with faction color
-                nr = int(r * (1 - intensity) + faction_color[0] * intensity)
-                ng = int(g * (1 - intensity) + faction_color[1] * intensity)
-                nb = int(b * (1 - intensity) + faction_color[2] * intensity)
-                pixels[x, y] = (nr, ng, nb, a)
-    
-    return result
-
-
-def main():
+    ], (80, 75, 65, 255))
+
+    return Image.fromarray(arr, "RGBA")
+
+
+def build_tint_lut(faction_color, intensity):
+    """Precompute per-channel lookup tables for one faction tint.
+
+    The blend r*(1-k) + c*k has only 256 possible inputs per channel for
+    a fixed (faction_color, intensity), so tinting reduces to a uint8
+    table gather. Build the (3, 256) table once per faction and reuse it
+    across every sprite of that faction.
+    """
+    ramp = np.arange(256, dtype=np.float32)
+    lut = np.empty((3, 256), dtype=np.uint8)
+    for c in range(3):
+        blended = ramp * (1 - intensity) + faction_color[c] * intensity
+        lut[c] = np.clip(blended, 0, 255).astype(np.uint8)
+    return lut
+
+
+# Tile edge for the blocked tint path: a 64x64 RGBA tile (16 KB in, 16 KB
+# out) stays resident in L1 while its LUT gathers run.
+TINT_TILE = 64
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _tint_kernel(arr, lut, out):
+        """JIT tint kernel: LUT gather over rows in parallel."""
+        h, w = arr.shape[:2]
+        for y in prange(h):
+            for x in range(w):
+                a = arr[y, x, 3]
+                # Branchless: tint unconditionally, multiply by the alpha
+                # mask. Transparent-heavy sprites would mispredict an
+                # if-per-pixel; a 0/1 multiply keeps the pipeline full.
+                m = np.uint8(a != 0)
+                for c in range(3):
+                    out[y, x, c] = lut[c, arr[y, x, c]] * m
+                out[y, x, 3] = a
+else:
+    _tint_kernel = None
+
+
+def apply_faction_tint(img, faction_color, intensity=0.4, lut=None, out=None):
+    """Apply a faction color tint to an image.
+
+    The blend is a per-channel LUT gather over the whole pixel array;
+    pass a precomputed ``build_tint_lut`` result to share one table
+    across many sprites of the same faction. ``out`` is an optional
+    (H, W, 4) scratch array reused between calls to avoid one RGBA
+    allocation per (sprite, faction) pair; the returned image shares
+    its memory, so encode or copy it before the scratch is reused.
+    """
+    if lut is None:
+        lut = build_tint_lut(faction_color, intensity)
+
+    # Move pixels through the buffer protocol in both directions: raw RGBA
+    # bytes in via tobytes/frombuffer, and the scratch array back out via
+    # Image.frombuffer below. No PixelAccess objects, no per-pixel boxing.
+    w, h = img.size
+    arr = np.frombuffer(img.tobytes("raw", "RGBA"), dtype=np.uint8).reshape(h, w, 4)
+    if out is None or out.shape != arr.shape:
+        out = np.empty_like(arr)
+
+    if _tint_kernel is not None:
+        # Numba path: row-parallel compiled loop, cached across runs.
+        _tint_kernel(arr, lut, out)
+    else:
+        # Process in TINT_TILE-square blocks so a full-atlas tint keeps
+        # its working set (and temporaries) in L1 instead of streaming
+        # whole-image intermediates through cache. Sprites at or below
+        # the tile size take a single iteration.
+        for y0 in range(0, h, TINT_TILE):
+            for x0 in range(0, w, TINT_TILE):
+                src = arr[y0:y0 + TINT_TILE, x0:x0 + TINT_TILE]
+                dst = out[y0:y0 + TINT_TILE, x0:x0 + TINT_TILE]
+                for c in range(3):
+                    dst[..., c] = lut[c][src[..., c]]
+
+                # Branchless transparency handling: multiply by the 0/1
+                # alpha mask instead of a predicated select. Transparent
+                # texels come out as (0, 0, 0, 0), which matches the
+                # generators' zeroed backgrounds.
+                dst[..., :3] *= src[..., 3:] != 0
+                dst[..., 3] = src[..., 3]
+
+    return Image.frombuffer("RGBA", (arr.shape[1], arr.shape[0]), out, "raw", "RGBA", 0, 1)
+
+
+# Registry of base sprites: name -> (factory, kwargs). Workers look sprites
+# up by name so only small strings cross the process boundary on submit.
+SPRITE_FACTORIES = {
+    "infantry": (create_infantry_sprite, {"size": 32}),
+    "ranger": (create_ranger_sprite, {"size": 32}),
+    "harvester": (create_harvester_sprite, {"size": 36}),
+    "depot": (create_depot_sprite, {"size": 64}),
+    "barracks": (create_barracks_sprite, {"size": 48}),
+    "supply_depot": (create_supply_depot_sprite, {"size": 32}),
+    "tech_lab": (create_tech_lab_sprite, {"size": 40}),
+    "turret": (create_turret_sprite, {"size": 24}),
+    "resource_temp": (create_resource_node_sprite, {"size": 40, "permanent": False}),
+    "resource_perm": (create_resource_node_sprite, {"size": 40, "permanent": True}),
+    "terrain": (create_terrain_sprite, {"size": 80}),
+}
+
+FACTIONS = {
+    "continuity": CONTINUITY_BLUE,
+    "collegium": COLLEGIUM_GOLD,
+}
+
+UNIT_SPRITES = ["infantry", "ranger", "harvester"]
+BUILDING_SPRITES = ["depot", "barracks", "supply_depot", "tech_lab", "turret"]
+
+# Sprites are pure functions of this module's source plus their parameters,
+# so a content hash of (source, name, params) identifies each output file.
+# Matching keys in .cache.json mean the file on disk is already current and
+# rendering can be skipped entirely.
+SRC_HASH = hashlib.blake2b(open(__file__, "rb").read(), digest_size=16).hexdigest()
+
+CACHE_FILE = os.path.join(OUTPUT_DIR, ".cache.json")
+
+
+def _sprite_key(*parts):
+    """Cache key for one output file from its generation parameters."""
+    text = "|".join(str(p) for p in parts)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    with open(CACHE_FILE, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def _quantize_exact(img, max_colors=32):
+    """Palettize an RGBA image losslessly when it has few distinct colors.
+
+    The sprites use a handful of flat fills each, so most fit in a
+    PNG-8 palette at half the bytes and decode cost. Returns a "P" mode
+    image with an RGBA palette, or None when the image has more than
+    ``max_colors`` distinct colors (e.g. the packed atlas) and should
+    stay full RGBA.
+    """
+    arr = np.asarray(img)
+    colors, inverse = np.unique(arr.reshape(-1, 4), axis=0, return_inverse=True)
+    if len(colors) > max_colors:
+        return None
+    indexed = Image.fromarray(inverse.reshape(arr.shape[:2]).astype(np.uint8), "P")
+    indexed.putpalette(colors.astype(np.uint8).tobytes(), rawmode="RGBA")
+    return indexed
+
+
+def _encode_png(img, optimize=False):
+    """Encode a PIL image to PNG bytes.
+
+    zlib level 6 (PIL's default) dominates write time for these tiny
+    images, so the default is level 1 for fast dev iteration; pass
+    ``optimize=True`` (the --optimize flag) for release-quality output.
+
+    An explicitly empty PngInfo strips ancillary metadata chunks so the
+    same pixels always encode to the same bytes, which keeps the
+    content-hash cache and downstream asset hashing honest.
+
+    Low-color images are palettized to indexed PNG-8 first; the
+    conversion is exact, so decoding still yields the original RGBA
+    pixels.
+    """
+    if img.mode == "RGBA":
+        indexed = _quantize_exact(img)
+        if indexed is not None:
+            img = indexed
+
+    buf = io.BytesIO()
+    pnginfo = PngImagePlugin.PngInfo()
+    if optimize:
+        img.save(buf, format="PNG", optimize=True, pnginfo=pnginfo)
+    else:
+        img.save(buf, format="PNG", compress_level=1, optimize=False, pnginfo=pnginfo)
+    return buf.getvalue()
+
+
+def _render_base(name, optimize=False):
+    """Worker: render one base sprite, returning (name, png_bytes)."""
+    factory, kwargs = SPRITE_FACTORIES[name]
+    return name, _encode_png(factory(**kwargs), optimize=optimize)
+
+
+def premultiply_alpha(img):
+    """Return a premultiplied-alpha copy of an RGBA image.
+
+    With premultiplied sprites the renderer blends with
+    (ONE, ONE_MINUS_SRC_ALPHA) and skips one multiply per fragment;
+    rounding is round-half-up via the +127 bias.
+    """
+    arr = np.asarray(img, dtype=np.uint8).copy()
+    rgb = arr[..., :3].astype(np.uint16)
+    a = arr[..., 3:4].astype(np.uint16)
+    arr[..., :3] = ((rgb * a + 127) // 255).astype(np.uint8)
+    return Image.fromarray(arr, "RGBA")
+
+
+def pack_atlas(images):
+    """Pack named images into one RGBA atlas with next-fit shelf packing.
+
+    ``images`` maps name -> PIL Image. Returns ``(atlas, frames)`` where
+    ``atlas`` is an (H, W, 4) uint8 array and ``frames`` maps each name to
+    its {"x", "y", "w", "h"} rectangle. Sprites sorted by height keep the
+    shelves dense enough for a catalogue this small.
+    """
+    entries = sorted(images.items(), key=lambda kv: (-kv[1].height, kv[0]))
+
+    total_area = sum(img.width * img.height for _, img in entries)
+    atlas_w = max(img.width for _, img in entries)
+    while atlas_w * atlas_w < total_area * 2:
+        atlas_w *= 2
+
+    frames = {}
+    x = y = shelf_h = 0
+    for name, img in entries:
+        if x + img.width > atlas_w:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        frames[name] = {"x": x, "y": y, "w": img.width, "h": img.height}
+        x += img.width
+        shelf_h = max(shelf_h, img.height)
+
+    atlas = np.zeros((y + shelf_h, atlas_w, 4), dtype=np.uint8)
+    for name, img in entries:
+        f = frames[name]
+        atlas[f["y"]:f["y"] + f["h"], f["x"]:f["x"] + f["w"]] = np.asarray(img)
+    return atlas, frames
+
+
+def write_atlas(directory, names, optimize=False):
+    """Pack the named sprites in ``directory`` into sprites.png + sprites.json.
+
+    The manifest lets the engine bind one texture and draw by frame
+    rectangle instead of loading one file (and one GPU texture) per sprite.
+    """
+    images = {
+        name: Image.open(os.path.join(directory, f"{name}.png")).convert("RGBA")
+        for name in names
+    }
+    atlas, frames = pack_atlas(images)
+
+    atlas_path = os.path.join(directory, "sprites.png")
+    with open(atlas_path, "wb") as f:
+        f.write(_encode_png(Image.fromarray(atlas, "RGBA"), optimize=optimize))
+
+    manifest = {"size": [atlas.shape[1], atlas.shape[0]], "frames": frames}
+    with open(os.path.join(directory, "sprites.json"), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return atlas_path
+
+
+class SpriteCatalog:
+    """Structure-of-arrays store for a set of sprites.
+
+    Pixels live in two contiguous arrays — ``rgb`` of shape
+    (N, MAX_H, MAX_W, 3) and ``alpha`` of shape (N, MAX_H, MAX_W) — with
+    every slot padded to the largest sprite and the real extents kept in
+    ``shapes``. Batch operations such as faction tinting then run as one
+    unit-stride sweep over the whole catalogue instead of dispatching on
+    N separate heap-allocated images.
+    """
+
+    def __init__(self, names, images):
+        self.names = list(names)
+        self.shapes = np.array([(img.height, img.width) for img in images], dtype=np.int32)
+        max_h, max_w = self.shapes.max(axis=0)
+        self.rgb = np.zeros((len(self.names), max_h, max_w, 3), dtype=np.uint8)
+        self.alpha = np.zeros((len(self.names), max_h, max_w), dtype=np.uint8)
+        for i, img in enumerate(images):
+            arr = np.asarray(img.convert("RGBA"))
+            h, w = arr.shape[:2]
+            self.rgb[i, :h, :w] = arr[..., :3]
+            self.alpha[i, :h, :w] = arr[..., 3]
+
+    def tint(self, lut):
+        """Tint every sprite at once; returns a new rgb array.
+
+        One LUT gather per channel covers the whole catalogue, with the
+        same branchless alpha masking as apply_faction_tint.
+        """
+        rgb = np.empty_like(self.rgb)
+        for c in range(3):
+            rgb[..., c] = lut[c][self.rgb[..., c]]
+        rgb *= (self.alpha != 0)[..., None]
+        return rgb
+
+    def compose(self, name, rgb=None):
+        """Build the PIL image for one slot, optionally from tinted rgb."""
+        i = self.names.index(name)
+        h, w = self.shapes[i]
+        source = self.rgb if rgb is None else rgb
+        return Image.fromarray(
+            np.dstack([source[i, :h, :w], self.alpha[i, :h, :w]]), "RGBA")
+
+
+def _write_file(path, data):
+    """Writer-thread task: persist one encoded sprite."""
+    with open(path, "wb") as f:
+        f.write(data)
+    print(f"  Created {path}")
+
+
+def _encode_and_write(path, img, optimize=False):
+    """Writer-thread task: encode one image and persist it."""
+    _write_file(path, _encode_png(img, optimize=optimize))
+
+
+def main(argv=None):
     """Generate all sprites."""
+    parser = argparse.ArgumentParser(description="Generate pixel art sprites for the RTS game.")
+    parser.add_argument(
+        "--optimize", action="store_true",
+        help="use maximum PNG compression for release builds (slower)")
+    parser.add_argument(
+        "--premultiply", action="store_true",
+        help="also emit *_premul.png premultiplied-alpha variants for "
+             "renderers using (ONE, ONE_MINUS_SRC_ALPHA) blending")
+    parser.add_argument(
+        "--only", metavar="NAMES",
+        help="comma-separated sprite names to generate (default: all)")
+    parser.add_argument(
+        "--factions", metavar="NAMES",
+        help="comma-separated factions to tint for (default: all)")
+    args = parser.parse_args(argv)
+
+    # Dev-loop filters: combined with the content-hash cache these restrict
+    # a run to just the sprites being iterated on. CI runs with no filters
+    # and emits everything.
+    base_names = list(SPRITE_FACTORIES)
+    if args.only is not None:
+        base_names = args.only.split(",")
+        for name in base_names:
+            if name not in SPRITE_FACTORIES:
+                parser.error(f"unknown sprite {name!r}; choose from {', '.join(SPRITE_FACTORIES)}")
+    faction_names = list(FACTIONS)
+    if args.factions is not None:
+        faction_names = args.factions.split(",")
+        for name in faction_names:
+            if name not in FACTIONS:
+                parser.error(f"unknown faction {name!r}; choose from {', '.join(FACTIONS)}")
+    filtered = args.only is not None or args.factions is not None
+
     print("Generating sprites...")
-    
-    # Base sprites (faction-neutral)
-    sprites = {
-        "infantry": create_infantry_sprite(32),
-        "ranger": create_ranger_sprite(32),
-        "harvester": create_harvester_sprite(36),
-        "depot": create_depot_sprite(64),
-        "barracks": create_barracks_sprite(48),
-        "supply_depot": create_supply_depot_sprite(32),
-        "tech_lab": create_tech_lab_sprite(40),
-        "turret": create_turret_sprite(24),
-        "resource_temp": create_resource_node_sprite(40, permanent=False),
-        "resource_perm": create_resource_node_sprite(40, permanent=True),
-        "terrain": create_terrain_sprite(80),
-    }
-    
-    # Save base sprites
-    for name, img in sprites.items():
-        path = os.path.join(OUTPUT_DIR, f"{name}.png")
-        img.save(path)
-        print(f"  Created {path}")
-    
-    # Create faction-tinted versions for units
-    factions = {
-        "continuity": CONTINUITY_BLUE,
-        "collegium": COLLEGIUM_GOLD,
-    }
-    
-    unit_sprites = ["infantry", "ranger", "harvester"]
-    building_sprites = ["depot", "barracks", "supply_depot", "tech_lab", "turret"]
-    
-    for faction_name, faction_color in factions.items():
-        faction_dir = os.path.join(OUTPUT_DIR, faction_name)
-        os.makedirs(faction_dir, exist_ok=True)
-        
-        for sprite_name in unit_sprites + building_sprites:
-            tinted = apply_faction_tint(sprites[sprite_name], faction_color, 0.35)
-            path = os.path.join(faction_dir, f"{sprite_name}.png")
-            tinted.save(path)
-            print(f"  Created {path}")
-    
+
+    cache = _load_cache()
+    new_cache = {}
+
+    # Render workers hand encoded bytes to a small writer pool so PNG
+    # encoding of the next sprite overlaps the disk write of the previous
+    # one instead of serializing CPU work behind I/O stalls.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool, \
+            ThreadPoolExecutor(max_workers=4) as io_pool:
+        writes = []
+
+        # Base sprites (faction-neutral). Rendering is CPU-bound and each
+        # sprite is independent, so they fan out across the pool; base
+        # sprites travel back as PNG bytes (already compressed). Sprites
+        # whose cache key still matches are not re-rendered.
+        stale = []
+        for name in base_names:
+            factory, kwargs = SPRITE_FACTORIES[name]
+            rel = f"{name}.png"
+            new_cache[rel] = _sprite_key(SRC_HASH, name, sorted(kwargs.items()), args.optimize)
+            if cache.get(rel) != new_cache[rel] or not os.path.exists(os.path.join(OUTPUT_DIR, rel)):
+                stale.append(name)
+
+        render_base = functools.partial(_render_base, optimize=args.optimize)
+        base_pngs = dict(pool.map(render_base, stale))
+
+        for name in base_names:
+            path = os.path.join(OUTPUT_DIR, f"{name}.png")
+            if name in base_pngs:
+                writes.append(io_pool.submit(_write_file, path, base_pngs[name]))
+            else:
+                print(f"  Cached {path}")
+
+        def base_bytes(name):
+            # Cached or filtered-out base sprites were not rendered this
+            # run; reload the PNG from disk, or render in-process if it
+            # was never generated (e.g. --factions on a clean tree).
+            if name not in base_pngs:
+                path = os.path.join(OUTPUT_DIR, f"{name}.png")
+                if os.path.exists(path):
+                    with open(path, "rb") as f:
+                        base_pngs[name] = f.read()
+                else:
+                    base_pngs[name] = _render_base(name, optimize=args.optimize)[1]
+            return base_pngs[name]
+
+        # Create faction-tinted versions for units. The tintable sprites
+        # sit in one SoA catalogue, so each faction is a single LUT gather
+        # over contiguous arrays rather than per-image tint calls.
+        tint_names = [n for n in UNIT_SPRITES + BUILDING_SPRITES if n in base_names]
+        catalog = SpriteCatalog(
+            tint_names,
+            [Image.open(io.BytesIO(base_bytes(name))).convert("RGBA") for name in tint_names]
+        ) if tint_names else None
+
+        for faction_name in (faction_names if tint_names else []):
+            faction_color = FACTIONS[faction_name]
+            faction_dir = os.path.join(OUTPUT_DIR, faction_name)
+            os.makedirs(faction_dir, exist_ok=True)
+
+            stale_tints = []
+            for sprite_name in tint_names:
+                rel = os.path.join(faction_name, f"{sprite_name}.png")
+                new_cache[rel] = _sprite_key(SRC_HASH, sprite_name, faction_color, 0.35, args.optimize)
+                path = os.path.join(OUTPUT_DIR, rel)
+                if cache.get(rel) == new_cache[rel] and os.path.exists(path):
+                    print(f"  Cached {path}")
+                    continue
+                stale_tints.append((sprite_name, path))
+
+            if not stale_tints:
+                continue
+            tinted_rgb = catalog.tint(build_tint_lut(faction_color, 0.35))
+            for sprite_name, path in stale_tints:
+                img = catalog.compose(sprite_name, rgb=tinted_rgb)
+                writes.append(io_pool.submit(_encode_and_write, path, img, args.optimize))
+
+        # Surface any write errors before the atlas pass reads these files.
+        for write in writes:
+            write.result()
+
+    # Pack each directory into a single spritesheet + manifest so the engine
+    # can bind one texture per directory instead of one per sprite. Rebuilt
+    # from the freshly written per-sprite files, so it is always current;
+    # on filtered runs a directory missing some members is left alone.
+    def try_write_atlas(directory, names):
+        if all(os.path.exists(os.path.join(directory, f"{n}.png")) for n in names):
+            print(f"  Created {write_atlas(directory, names, optimize=args.optimize)}")
+        else:
+            print(f"  Skipped atlas for {directory} (missing member sprites)")
+
+    try_write_atlas(OUTPUT_DIR, list(SPRITE_FACTORIES))
+    for faction_name in faction_names:
+        try_write_atlas(os.path.join(OUTPUT_DIR, faction_name), UNIT_SPRITES + BUILDING_SPRITES)
+
+    if args.premultiply:
+        # Derived from the freshly written straight-alpha files so the
+        # variants always match, whatever was cached this run.
+        for rel in new_cache:
+            path = os.path.join(OUTPUT_DIR, rel)
+            premul = premultiply_alpha(Image.open(path).convert("RGBA"))
+            _write_file(path[:-4] + "_premul.png", _encode_png(premul, optimize=args.optimize))
+
+    if filtered:
+        # Keep manifest entries for files this run did not touch so a later
+        # full run still gets cache hits on them.
+        merged = dict(cache)
+        merged.update(new_cache)
+        new_cache = merged
+    _save_cache(new_cache)
     print(f"\nAll sprites saved to {OUTPUT_DIR}")
 
 